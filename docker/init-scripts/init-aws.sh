@@ -23,7 +23,22 @@ set -u  # Error on undefined variables
 
 export AWS_ACCESS_KEY_ID=test
 export AWS_SECRET_ACCESS_KEY=test
-export AWS_DEFAULT_REGION=ap-south-1
+export AWS_DEFAULT_REGION="${AWS_DYNAMODB_REGION:-ap-south-1}"
+
+# Resource names come from the project .env via localstack-docker-compose.yaml,
+# with the same defaults as scripts/init_localstack.py
+S3_FILES_BUCKET="${AWS_S3_BUCKET_NAME:-flopods-files-dev}"
+S3_DOCUMENTS_BUCKET="${DOCUMENT_S3_BUCKET:-flopods-documents-dev}"
+S3_VECTORS_BUCKET="${DOCUMENT_VECTOR_S3_BUCKET:-flopods-vectors-dev}"
+
+DYNAMODB_POD_TABLE="${AWS_DYNAMODB_POD_TABLE:-flopods-pods-dev}"
+DYNAMODB_EXECUTION_TABLE="${AWS_DYNAMODB_EXECUTION_TABLE:-flopods-executions-dev}"
+DYNAMODB_CONTEXT_TABLE="${AWS_DYNAMODB_CONTEXT_TABLE:-flopods-context-dev}"
+DYNAMODB_SESSION_TABLE="${AWS_DYNAMODB_SESSION_TABLE:-flopods-sessions-dev}"
+DYNAMODB_CACHE_TABLE="${AWS_DYNAMODB_CACHE_TABLE:-flopods-cache-dev}"
+
+SES_NOREPLY_EMAIL="${AWS_SES_NO_REPLY_EMAIL:-noreply@flopods.local}"
+SES_SUPPORT_EMAIL="${AWS_SES_SUPPORT_EMAIL:-support@flopods.local}"
 
 echo ""
 echo "╔══════════════════════════════════════════════════════════════════════════╗"
@@ -76,21 +91,21 @@ create_bucket() {
 }
 
 # Create all S3 buckets
-create_bucket "flopods-files-dev" "General file uploads"
-create_bucket "flopods-documents-dev" "Document processing files"
-create_bucket "flopods-vectors-dev" "Vector embeddings storage"
+create_bucket "${S3_FILES_BUCKET}" "General file uploads"
+create_bucket "${S3_DOCUMENTS_BUCKET}" "Document processing files"
+create_bucket "${S3_VECTORS_BUCKET}" "Vector embeddings storage"
 
 echo ""
 echo "📋 Configuring bucket policies..."
 
 # Enable versioning for files bucket
 awslocal s3api put-bucket-versioning \
-  --bucket flopods-files-dev \
+  --bucket "${S3_FILES_BUCKET}" \
   --versioning-configuration Status=Enabled
 
 # Enable CORS for document uploads (if needed for direct client uploads)
 awslocal s3api put-bucket-cors \
-  --bucket flopods-documents-dev \
+  --bucket "${S3_DOCUMENTS_BUCKET}" \
   --cors-configuration '{
     "CORSRules": [
       {
@@ -128,10 +143,10 @@ create_table() {
 # ───────────────────────────────────────────────────────────────────────────────
 # Pods Table
 # ───────────────────────────────────────────────────────────────────────────────
-echo "📊 Creating flopods-pods-dev..."
-if ! create_table "flopods-pods-dev"; then
+echo "📊 Creating ${DYNAMODB_POD_TABLE}..."
+if ! create_table "${DYNAMODB_POD_TABLE}"; then
   awslocal dynamodb create-table \
-    --table-name flopods-pods-dev \
+    --table-name "${DYNAMODB_POD_TABLE}" \
     --attribute-definitions \
       AttributeName=pk,AttributeType=S \
       AttributeName=sk,AttributeType=S \
@@ -163,16 +178,16 @@ if ! create_table "flopods-pods-dev"; then
       ]" \
     --billing-mode PAY_PER_REQUEST \
     >/dev/null
-  echo "Created: flopods-pods-dev"
+  echo "Created: ${DYNAMODB_POD_TABLE}"
 fi
 
 # ───────────────────────────────────────────────────────────────────────────────
 # Executions Table
 # ───────────────────────────────────────────────────────────────────────────────
-echo "📊 Creating flopods-executions-dev..."
-if ! create_table "flopods-executions-dev"; then
+echo "📊 Creating ${DYNAMODB_EXECUTION_TABLE}..."
+if ! create_table "${DYNAMODB_EXECUTION_TABLE}"; then
   awslocal dynamodb create-table \
-    --table-name flopods-executions-dev \
+    --table-name "${DYNAMODB_EXECUTION_TABLE}" \
     --attribute-definitions \
       AttributeName=pk,AttributeType=S \
       AttributeName=sk,AttributeType=S \
@@ -204,16 +219,16 @@ if ! create_table "flopods-executions-dev"; then
       ]" \
     --billing-mode PAY_PER_REQUEST \
     >/dev/null
-  echo "Created: flopods-executions-dev"
+  echo "Created: ${DYNAMODB_EXECUTION_TABLE}"
 fi
 
 # ───────────────────────────────────────────────────────────────────────────────
 # Context Table
 # ───────────────────────────────────────────────────────────────────────────────
-echo "📊 Creating flopods-context-dev..."
-if ! create_table "flopods-context-dev"; then
+echo "📊 Creating ${DYNAMODB_CONTEXT_TABLE}..."
+if ! create_table "${DYNAMODB_CONTEXT_TABLE}"; then
   awslocal dynamodb create-table \
-    --table-name flopods-context-dev \
+    --table-name "${DYNAMODB_CONTEXT_TABLE}" \
     --attribute-definitions \
       AttributeName=pk,AttributeType=S \
       AttributeName=sk,AttributeType=S \
@@ -235,16 +250,16 @@ if ! create_table "flopods-context-dev"; then
       ]" \
     --billing-mode PAY_PER_REQUEST \
     >/dev/null
-  echo "Created: flopods-context-dev"
+  echo "Created: ${DYNAMODB_CONTEXT_TABLE}"
 fi
 
 # ───────────────────────────────────────────────────────────────────────────────
 # Sessions Table
 # ───────────────────────────────────────────────────────────────────────────────
-echo "📊 Creating flopods-sessions-dev..."
-if ! create_table "flopods-sessions-dev"; then
+echo "📊 Creating ${DYNAMODB_SESSION_TABLE}..."
+if ! create_table "${DYNAMODB_SESSION_TABLE}"; then
   awslocal dynamodb create-table \
-    --table-name flopods-sessions-dev \
+    --table-name "${DYNAMODB_SESSION_TABLE}" \
     --attribute-definitions \
       AttributeName=pk,AttributeType=S \
       AttributeName=sk,AttributeType=S \
@@ -253,16 +268,16 @@ if ! create_table "flopods-sessions-dev"; then
       AttributeName=sk,KeyType=RANGE \
     --billing-mode PAY_PER_REQUEST \
     >/dev/null
-  echo "Created: flopods-sessions-dev"
+  echo "Created: ${DYNAMODB_SESSION_TABLE}"
 fi
 
 # ───────────────────────────────────────────────────────────────────────────────
 # Cache Table (with TTL)
 # ───────────────────────────────────────────────────────────────────────────────
-echo "📊 Creating flopods-cache-dev..."
-if ! create_table "flopods-cache-dev"; then
+echo "📊 Creating ${DYNAMODB_CACHE_TABLE}..."
+if ! create_table "${DYNAMODB_CACHE_TABLE}"; then
   awslocal dynamodb create-table \
-    --table-name flopods-cache-dev \
+    --table-name "${DYNAMODB_CACHE_TABLE}" \
     --attribute-definitions \
       AttributeName=pk,AttributeType=S \
       AttributeName=sk,AttributeType=S \
@@ -274,11 +289,11 @@ if ! create_table "flopods-cache-dev"; then
 
   # Enable TTL
   awslocal dynamodb update-time-to-live \
-    --table-name flopods-cache-dev \
+    --table-name "${DYNAMODB_CACHE_TABLE}" \
     --time-to-live-specification "Enabled=true,AttributeName=ttl" \
     >/dev/null
 
-  echo "Created: flopods-cache-dev (with TTL)"
+  echo "Created: ${DYNAMODB_CACHE_TABLE} (with TTL)"
 fi
 
 echo ""
@@ -293,11 +308,11 @@ echo "╚═══════════════════════
 echo ""
 
 # Verify email identities
-awslocal ses verify-email-identity --email-address noreply@flopods.local
-awslocal ses verify-email-identity --email-address support@flopods.local
+awslocal ses verify-email-identity --email-address "${SES_NOREPLY_EMAIL}"
+awslocal ses verify-email-identity --email-address "${SES_SUPPORT_EMAIL}"
 
-echo "Verified: noreply@flopods.local"
-echo "Verified: support@flopods.local"
+echo "Verified: ${SES_NOREPLY_EMAIL}"
+echo "Verified: ${SES_SUPPORT_EMAIL}"
 echo ""
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -352,15 +367,15 @@ echo "╚═══════════════════════
 echo ""
 
 echo "📦 S3 Buckets:"
-awslocal s3 ls | grep flopods
+awslocal s3 ls
 
 echo ""
 echo "🗄️  DynamoDB Tables:"
-awslocal dynamodb list-tables --output text | grep flopods
+awslocal dynamodb list-tables --output text
 
 echo ""
 echo "📨 SQS Queues:"
-awslocal sqs list-queues --output text | grep flopods
+awslocal sqs list-queues --output text
 
 echo ""
 echo "╔══════════════════════════════════════════════════════════════════════════╗"
@@ -0,0 +1,31 @@
+import functools
+import os
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+SCRIPTS_DIR = Path(__file__).parent
+
+
+@functools.lru_cache(maxsize=None)
+def find_env(start):
+    """Return the nearest .env at or above start, or None if there is none"""
+    for directory in (start, *start.parents):
+        env_file = directory / ".env"
+        if env_file.exists():
+            return env_file
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def load():
+    """Load the project .env into os.environ once per process and return its path"""
+    env_file = find_env(SCRIPTS_DIR)
+    if env_file is None:
+        return None
+
+    # Same precedence as load_dotenv: variables already set in the environment win
+    for key, value in dotenv_values(env_file).items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+    return env_file
@@ -1,26 +1,26 @@
+import asyncio
+import json
 import os
+import shutil
 import subprocess
 import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from dotenv import load_dotenv
+from _env import load
 
-# Load .env from project root (2 levels up from scripts/)
-root_dir = Path(__file__).parent.parent.parent
-env_file = root_dir / ".env"
-
-# Fallback to one level up if not found
-if not env_file.exists():
-    root_dir = Path(__file__).parent.parent
-    env_file = root_dir / ".env"
-
-load_dotenv(env_file)
+env_file = load()
 
 # Container Configuration
 CONTAINER_RUNTIME = os.getenv("CONTAINER_RUNTIME", "docker").lower().strip()
 if CONTAINER_RUNTIME not in ["docker", "podman"]:
     CONTAINER_RUNTIME = "docker"
 
+# Resolve the runtime binary once instead of a PATH lookup on every exec
+CONTAINER_RUNTIME_BIN = shutil.which(CONTAINER_RUNTIME) or CONTAINER_RUNTIME
+
 # Container names from docker-compose
 DB_CONTAINER = os.getenv("DB_CONTAINER_NAME", "flopods-db")
 LOCALSTACK_CONTAINER = os.getenv("LOCALSTACK_CONTAINER_NAME", "localstack")
@@ -34,6 +34,17 @@ REDIS_VOLUME = "redis-data"
 # Network name
 NETWORK_NAME = "flopods_network"
 
+# Health polling
+HEALTH_TIMEOUT = 30
+LOCALSTACK_ENDPOINT = os.getenv("AWS_DYNAMODB_ENDPOINT", "http://localhost:4566")
+LOCALSTACK_HEALTH_URL = f"{LOCALSTACK_ENDPOINT}/_localstack/health"
+# Matches SERVICES in localstack-docker-compose.yaml; every other service reports "disabled"
+LOCALSTACK_SERVICES = ("s3", "dynamodb", "ses", "sqs")
+
+# LocalStack runs docker/init-scripts/*.sh itself via the ready.d hook
+INIT_TIMEOUT = 120
+LOCALSTACK_INIT_URL = f"{LOCALSTACK_ENDPOINT}/_localstack/init/ready"
+
 # Docker compose files
 DOCKER_DIR = Path(__file__).parent.parent / "docker"
 COMPOSE_FILES = {
@@ -43,60 +54,147 @@ COMPOSE_FILES = {
 }
 
 
-def run(cmd, capture=False):
-    """Run shell command"""
-    print(f"🔄 {cmd[:70]}...")
-    if capture:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        return result
-    else:
-        result = subprocess.run(cmd, shell=True)
-        return result
-
-
-def stop_container(name):
-    """Stop a running container"""
-    print(f"\n⏹️  Stopping container: {name}")
-    run(f"{CONTAINER_RUNTIME} stop {name} 2>/dev/null || true")
+def run(argv, phase):
+    """Run a command without a shell, streaming stdout and stderr line by line tagged with [phase]"""
+    print(f"🔄 {' '.join(argv)[:70]}...")
+    # Failures are expected during teardown (e.g. nothing to remove), so the
+    # return code is only reported, never checked; errors still show up tagged
+    with subprocess.Popen(
+        argv,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+    ) as proc:
+        for line in proc.stdout:
+            sys.stdout.write(f"[{phase}] {line}")
+    return proc.returncode
 
 
-def remove_container(name):
-    """Remove a container"""
-    print(f"🗑️  Removing container: {name}")
-    run(f"{CONTAINER_RUNTIME} rm {name} 2>/dev/null || true")
+def remove_containers(*names):
+    """Kill and remove containers in a single call"""
+    print(f"🗑️  Removing containers: {', '.join(names)}")
+    run([CONTAINER_RUNTIME_BIN, "rm", "-f", *names], "containers")
 
 
-def remove_volume(name):
-    """Remove a volume"""
-    print(f"💾 Removing volume: {name}")
-    run(f"{CONTAINER_RUNTIME} volume rm {name} 2>/dev/null || true")
+def remove_volumes(*names):
+    """Remove volumes in a single call"""
+    print(f"💾 Removing volumes: {', '.join(names)}")
+    run([CONTAINER_RUNTIME_BIN, "volume", "rm", "-f", *names], "volumes")
 
 
 def prune_network(name):
     """Remove unused networks"""
     print(f"🌐 Pruning network: {name}")
-    run(f"{CONTAINER_RUNTIME} network rm {name} 2>/dev/null || true")
+    run([CONTAINER_RUNTIME_BIN, "network", "rm", name], "network")
+
+
+async def compose_up(service_name, compose_file):
+    """Start a compose stack in detached mode, prefixing its output with the service name"""
+    print(f"🚀 Starting {service_name} from: {compose_file.name}")
+    proc = await asyncio.create_subprocess_exec(
+        CONTAINER_RUNTIME_BIN, "compose", "-f", str(compose_file), "up", "-d",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    async for line in proc.stdout:
+        print(f"[{service_name}] {line.decode(errors='replace').rstrip()}")
+    return await proc.wait()
+
+
+async def compose_up_all(stacks):
+    """Start every compose stack concurrently with interleaved, prefixed output"""
+    return await asyncio.gather(*(compose_up(*stack) for stack in stacks))
+
+
+def poll(check, timeout=HEALTH_TIMEOUT):
+    """Call check() with exponential backoff until it returns True or timeout expires"""
+    deadline = time.monotonic() + timeout
+    delay = 0.2
+    while not check():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 2)
+    return True
+
+
+def wait_healthy(name, timeout=HEALTH_TIMEOUT):
+    """Wait for a container's healthcheck to report healthy"""
+
+    def is_healthy():
+        result = subprocess.run(
+            [CONTAINER_RUNTIME_BIN, "inspect", "--format", "{{.State.Health.Status}}", name],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        return result.stdout.strip() == "healthy"
+
+    return poll(is_healthy, timeout)
+
+
+def fetch_json(url):
+    """GET a JSON document from LocalStack"""
+    with urllib.request.urlopen(url, timeout=2) as response:
+        return json.load(response)
+
+
+def wait_localstack_healthy(timeout=HEALTH_TIMEOUT):
+    """Wait for the LocalStack services this stack enables to report available or running"""
+
+    def is_healthy():
+        try:
+            services = fetch_json(LOCALSTACK_HEALTH_URL).get("services", {})
+        except (OSError, ValueError):
+            return False
+        return all(services.get(service) in ("available", "running") for service in LOCALSTACK_SERVICES)
+
+    return poll(is_healthy, timeout)
+
+
+def wait_localstack_initialized(timeout=INIT_TIMEOUT):
+    """Wait for LocalStack's ready.d scripts to finish
+
+    Returns True if they all succeeded, False if one failed or none ran, and
+    None if they were still running when the timeout expired.
+    """
+    status = {}
+
+    def is_completed():
+        try:
+            status.update(fetch_json(LOCALSTACK_INIT_URL))
+        except (OSError, ValueError):
+            return False
+        completed = status.get("completed")
+        if isinstance(completed, dict):
+            completed = completed.get("READY")
+        return bool(completed)
+
+    if not poll(is_completed, timeout):
+        return None
+    scripts = status.get("scripts") or []
+    return bool(scripts) and all(script.get("state") == "SUCCESSFUL" for script in scripts)
 
 
 def run_init_localstack():
-    """Call the init-localstack.py script"""
+    """Run init_localstack.main() in-process, reusing the already loaded .env; True on success"""
     print(f"\n📦 Running LocalStack initialization...")
-    init_script = Path(__file__).parent / "init-localstack.py"
-    if init_script.exists():
-        subprocess.run([sys.executable, str(init_script)])
-    else:
-        print(f"⚠️  init-localstack.py not found at {init_script}")
+    from init_localstack import main as init_main
+
+    return init_main()
 
 
 def main():
     print("\n╔════════════════════════════════════════════════════════════╗")
     print("║  🔄 FLOPODS Database & Container Reset                    ║")
     print(f"║  Runtime: {CONTAINER_RUNTIME.upper()}                                      ║")
-    print(f"║  Env File: {env_file}                           ║")
+    print(f"║  Env File: {env_file or 'not found'}                           ║")
     print("╚════════════════════════════════════════════════════════════╝\n")
 
     print("⚠️  WARNING: This will:")
-    print("   - Stop all containers (flopods-db, localstack, flopods-redis)")
+    print("   - Remove all containers (flopods-db, localstack, flopods-redis)")
     print("   - Delete all volumes (data loss!)")
     print("   - Remove network configuration")
     print("   - Reinitialize LocalStack with fresh services\n")
@@ -106,69 +204,95 @@ def main():
         print("❌ Reset cancelled.")
         sys.exit(0)
 
+    # rm -f kills and removes in one call; a graceful stop is pointless when
+    # the data is deleted right after
     print("\n" + "="*70)
-    print("PHASE 1: Stopping Containers")
+    print("PHASE 1: Removing Containers")
     print("="*70)
-    stop_container(DB_CONTAINER)
-    stop_container(LOCALSTACK_CONTAINER)
-    stop_container(REDIS_CONTAINER)
+    remove_containers(DB_CONTAINER, LOCALSTACK_CONTAINER, REDIS_CONTAINER)
 
     print("\n" + "="*70)
-    print("PHASE 2: Removing Containers")
+    print("PHASE 2: Removing Volumes (Data Deletion)")
     print("="*70)
-    remove_container(DB_CONTAINER)
-    remove_container(LOCALSTACK_CONTAINER)
-    remove_container(REDIS_CONTAINER)
+    remove_volumes(DB_VOLUME, LOCALSTACK_VOLUME, REDIS_VOLUME)
 
     print("\n" + "="*70)
-    print("PHASE 3: Removing Volumes (Data Deletion)")
-    print("="*70)
-    remove_volume(DB_VOLUME)
-    remove_volume(LOCALSTACK_VOLUME)
-    remove_volume(REDIS_VOLUME)
-
-    print("\n" + "="*70)
-    print("PHASE 4: Pruning Networks")
+    print("PHASE 3: Pruning Networks")
     print("="*70)
     prune_network(NETWORK_NAME)
 
     print("\n" + "="*70)
-    print("PHASE 5: Starting Fresh Containers")
+    print("PHASE 4: Starting Fresh Containers")
     print("="*70)
 
-    # Start containers from separate compose files
+    # Start containers from separate compose files; the stacks are independent,
+    # so bring them up concurrently instead of one after another
+    stacks = []
     for service_name, compose_file in COMPOSE_FILES.items():
         if compose_file.exists():
-            print(f"\n🚀 Starting {service_name} from: {compose_file.name}")
-            run(f"{CONTAINER_RUNTIME} compose -f {compose_file} up -d")
+            stacks.append((service_name, compose_file))
         else:
             print(f"⚠️  Skipping {service_name}: {compose_file} not found")
 
+    print()
+    asyncio.run(compose_up_all(stacks))
+
     # Wait for containers to be healthy
     print("\n⏳ Waiting for containers to be healthy...")
-    import time
-    time.sleep(10)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        checks = {
+            DB_CONTAINER: executor.submit(wait_healthy, DB_CONTAINER),
+            REDIS_CONTAINER: executor.submit(wait_healthy, REDIS_CONTAINER),
+            LOCALSTACK_CONTAINER: executor.submit(wait_localstack_healthy),
+        }
+    for name, check in checks.items():
+        if check.result():
+            print(f"✓ {name} is healthy")
+        else:
+            print(f"⚠️  {name} not healthy after {HEALTH_TIMEOUT}s")
+
+    # LocalStack provisions its resources in-container through the ready.d hook;
+    # initialize from the host only when the hook failed or did not run at all.
+    # A hook that is merely slow is left alone: host-side init would create the
+    # tables first without their GSIs/TTL and init-aws.sh would then skip them.
+    print("\n⏳ Waiting for LocalStack init scripts...")
+    initialized = wait_localstack_initialized()
+    if initialized is None:
+        print(f"⚠️  {LOCALSTACK_CONTAINER} ready.d hook still running after {INIT_TIMEOUT}s, not initializing from host")
+        print(f"   Follow its progress with: {CONTAINER_RUNTIME} logs -f {LOCALSTACK_CONTAINER}")
+    elif initialized:
+        print(f"✓ {LOCALSTACK_CONTAINER} initialized by ready.d hook")
+    else:
+        print(f"⚠️  {LOCALSTACK_CONTAINER} ready.d hook failed or did not run, initializing from host")
+        initialized = run_init_localstack()
 
-    # Run LocalStack initialization
-    run_init_localstack()
+    if initialized:
+        localstack_summary = "✓ LocalStack services initialized"
+    elif initialized is None:
+        localstack_summary = "⚠️  LocalStack services still initializing (ready.d hook did not finish in time)"
+    else:
+        localstack_summary = "⚠️  LocalStack services NOT initialized (see errors above)"
 
     print("\n" + "="*70)
     print("Reset Complete!")
     print("="*70)
     print(f"""
-✓ All containers stopped and removed
+✓ All containers removed
 ✓ All volumes deleted
 ✓ Fresh containers started from:
   - {COMPOSE_FILES['database'].name}
   - {COMPOSE_FILES['localstack'].name}
   - {COMPOSE_FILES['redis'].name}
-✓ LocalStack services initialized
+{localstack_summary}
 
 To verify status, run:
   {CONTAINER_RUNTIME} ps -a
   {CONTAINER_RUNTIME} volume ls
 """)
 
+    if not initialized:
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,205 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from _env import load
+
+env_file = load()
+
+# Container Configuration - Default to docker, support both Docker and Podman
+CONTAINER_RUNTIME = os.getenv("CONTAINER_RUNTIME", "docker").lower().strip()
+LOCALSTACK_CONTAINER_NAME = os.getenv("LOCALSTACK_CONTAINER_NAME", "localstack")
+
+# AWS Configuration
+AWS_REGION = os.getenv("AWS_DYNAMODB_REGION", "ap-south-1")
+AWS_DYNAMODB_ENDPOINT = os.getenv("AWS_DYNAMODB_ENDPOINT", "http://localhost:4566")
+
+# LocalStack SQS Config
+LOCALSTACK_SQS_ENDPOINT = os.getenv("AWS_SQS_ENDPOINT", AWS_DYNAMODB_ENDPOINT)
+
+# DynamoDB Table Names
+DYNAMODB_POD_TABLE = os.getenv("AWS_DYNAMODB_POD_TABLE", "flopods-pods-dev")
+DYNAMODB_SESSION_TABLE = os.getenv("AWS_DYNAMODB_SESSION_TABLE", "flopods-sessions-dev")
+DYNAMODB_EXECUTION_TABLE = os.getenv("AWS_DYNAMODB_EXECUTION_TABLE", "flopods-executions-dev")
+DYNAMODB_CACHE_TABLE = os.getenv("AWS_DYNAMODB_CACHE_TABLE", "flopods-cache-dev")
+DYNAMODB_CONTEXT_TABLE = os.getenv("AWS_DYNAMODB_CONTEXT_TABLE", "flopods-context-dev")
+
+# S3 Bucket Names
+S3_DOCUMENTS_BUCKET = os.getenv("DOCUMENT_S3_BUCKET", "flopods-documents-dev")
+S3_VECTORS_BUCKET = os.getenv("DOCUMENT_VECTOR_S3_BUCKET", "flopods-vectors-dev")
+S3_FILES_BUCKET = os.getenv("AWS_S3_BUCKET_NAME", "flopods-files-dev")
+
+# SES Emails
+SES_NOREPLY_EMAIL = os.getenv("AWS_SES_NO_REPLY_EMAIL", "noreply@flopods.local")
+SES_SUPPORT_EMAIL = os.getenv("AWS_SES_SUPPORT_EMAIL", "support@flopods.local")
+
+# Validate container runtime
+if CONTAINER_RUNTIME not in ["docker", "podman"]:
+    print(f"⚠️  Invalid CONTAINER_RUNTIME: {CONTAINER_RUNTIME}")
+    print(f"   Defaulting to docker")
+    CONTAINER_RUNTIME = "docker"
+
+# Resolve the runtime binary once instead of a PATH lookup on every exec
+CONTAINER_RUNTIME_BIN = shutil.which(CONTAINER_RUNTIME) or CONTAINER_RUNTIME
+
+# Every DynamoDB table shares the same key schema
+TABLE_SCHEMA = {
+    "AttributeDefinitions": [
+        {"AttributeName": "pk", "AttributeType": "S"},
+        {"AttributeName": "sk", "AttributeType": "S"},
+    ],
+    "KeySchema": [
+        {"AttributeName": "pk", "KeyType": "HASH"},
+        {"AttributeName": "sk", "KeyType": "RANGE"},
+    ],
+    "BillingMode": "PAY_PER_REQUEST",
+}
+
+# Outside us-east-1, S3 needs the region spelled out on bucket creation
+BUCKET_CONFIG = (
+    {} if AWS_REGION == "us-east-1" else {"CreateBucketConfiguration": {"LocationConstraint": AWS_REGION}}
+)
+
+# Resources to provision as (service, boto3 method, params), built once at import.
+# The first param of each entry names the resource in the progress output.
+RESOURCES = (
+    # S3 Buckets
+    ("s3", "create_bucket", {"Bucket": S3_DOCUMENTS_BUCKET, **BUCKET_CONFIG}),
+    ("s3", "create_bucket", {"Bucket": S3_VECTORS_BUCKET, **BUCKET_CONFIG}),
+    ("s3", "create_bucket", {"Bucket": S3_FILES_BUCKET, **BUCKET_CONFIG}),
+    # DynamoDB Tables
+    ("dynamodb", "create_table", {"TableName": DYNAMODB_POD_TABLE, **TABLE_SCHEMA}),
+    ("dynamodb", "create_table", {"TableName": DYNAMODB_EXECUTION_TABLE, **TABLE_SCHEMA}),
+    ("dynamodb", "create_table", {"TableName": DYNAMODB_CONTEXT_TABLE, **TABLE_SCHEMA}),
+    ("dynamodb", "create_table", {"TableName": DYNAMODB_SESSION_TABLE, **TABLE_SCHEMA}),
+    ("dynamodb", "create_table", {"TableName": DYNAMODB_CACHE_TABLE, **TABLE_SCHEMA}),
+    # SES
+    ("ses", "verify_email_identity", {"EmailAddress": SES_NOREPLY_EMAIL}),
+    ("ses", "verify_email_identity", {"EmailAddress": SES_SUPPORT_EMAIL}),
+    # SQS Queues
+    (
+        "sqs",
+        "create_queue",
+        {
+            "QueueName": "flopods-document-processing.fifo",
+            "Attributes": {
+                "FifoQueue": "true",
+                "ContentBasedDeduplication": "true",
+                "VisibilityTimeout": "300",
+                "MessageRetentionPeriod": "1209600",
+            },
+        },
+    ),
+    (
+        "sqs",
+        "create_queue",
+        {
+            "QueueName": "flopods-document-processing-dlq.fifo",
+            "Attributes": {"FifoQueue": "true", "MessageRetentionPeriod": "1209600"},
+        },
+    ),
+)
+
+# Runs inside the LocalStack container: one interpreter and one boto3 import
+# provision the whole plan, which arrives as JSON on stdin
+BOOTSTRAP_PY = """
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+
+plan = json.load(sys.stdin)
+session = boto3.session.Session(
+    aws_access_key_id="test",
+    aws_secret_access_key="test",
+    region_name=plan["region"],
+)
+clients = {
+    service: session.client(service, endpoint_url="http://localhost:4566")
+    for service in {service for service, _, _ in plan["resources"]}
+}
+
+def provision(resource):
+    service, method, params = resource
+    label = f"🔄 {service} {method} {next(iter(params.values()))}..."
+    try:
+        getattr(clients[service], method)(**params)
+        return True, f"{label} Done"
+    except ClientError:
+        return True, f"{label} ⚠️  Skipped (may already exist)"
+    except BotoCoreError as error:
+        return False, f"{label} ❌ Failed: {error}"
+
+# Results come back in plan order, so the output is stable across runs
+failed = False
+with ThreadPoolExecutor(max_workers=8) as executor:
+    for ok, line in executor.map(provision, plan["resources"]):
+        failed = failed or not ok
+        print(line, flush=True)
+sys.exit(1 if failed else 0)
+"""
+
+# Read-only listings shown after provisioning, in display order
+VERIFICATIONS = (
+    ("📦 S3 Buckets:", ("s3", "ls")),
+    ("🗄️  DynamoDB Tables:", ("dynamodb", "list-tables")),
+    ("📨 SQS Queues:", ("sqs", "list-queues")),
+)
+
+def list_resources(args):
+    """Run a read-only awslocal command in the container and return its output"""
+    result = subprocess.run(
+        [CONTAINER_RUNTIME_BIN, "exec", "-i", LOCALSTACK_CONTAINER_NAME, "awslocal", *args, "--region", AWS_REGION],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout + result.stderr
+
+def run(resources):
+    """Provision resources with a single exec of BOOTSTRAP_PY inside the LocalStack container"""
+    result = subprocess.run(
+        [CONTAINER_RUNTIME_BIN, "exec", "-i", LOCALSTACK_CONTAINER_NAME, "python3", "-c", BOOTSTRAP_PY],
+        input=json.dumps({"region": AWS_REGION, "resources": resources}),
+        text=True,
+        check=False,
+    )
+    return result.returncode == 0
+
+def main():
+    print("\n╔════════════════════════════════════════════════════════════╗")
+    print(f"║  🚀 FLOPODS LocalStack Initialization ({CONTAINER_RUNTIME.upper()})            ║")
+    print(f"║  Region: {AWS_REGION}                                   ║")
+    print(f"║  Container: {LOCALSTACK_CONTAINER_NAME}                              ║")
+    print(f"║  Env File: {env_file or 'not found'}                           ║")
+    print("╚════════════════════════════════════════════════════════════╝\n")
+
+    # Resources are independent of each other; BOOTSTRAP_PY creates them concurrently
+    print("📦 Creating S3 Buckets, 🗄️  DynamoDB Tables, 📧 SES identities and 📨 SQS Queues...")
+    succeeded = run(RESOURCES)
+    print()
+
+    # Verify
+    print("╔════════════════════════════════════════════════════════════╗")
+    print("║  Verification                                           ║")
+    print("╚════════════════════════════════════════════════════════════╝\n")
+
+    # The listings are independent, so run them concurrently and print the
+    # captured output in a fixed order from this thread
+    with ThreadPoolExecutor(max_workers=len(VERIFICATIONS)) as executor:
+        listings = [(title, executor.submit(list_resources, args)) for title, args in VERIFICATIONS]
+    print("\n\n".join(f"{title}\n{listing.result().rstrip()}" for title, listing in listings))
+
+    if succeeded:
+        print("\nLocalStack initialization complete!\n")
+    else:
+        print("\n❌ LocalStack initialization failed, see the errors above\n")
+    return succeeded
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)